@@ -14,7 +14,13 @@ from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
 # Import extracted modules
-from src.api import get_access_token, refresh_yahoo_token, set_access_token, yahoo_api_call
+from src.api import (
+    close_session,
+    get_access_token,
+    refresh_yahoo_token,
+    set_access_token,
+    yahoo_api_call,
+)
 from src.parsers import parse_team_roster, parse_yahoo_free_agent_players
 from src.services import analyze_reddit_sentiment
 
@@ -691,6 +697,11 @@ async def list_tools() -> list[Tool]:
                         "anyOf": [{"type": "integer"}, {"type": "null"}],
                         "description": "Season year (defaults to current NFL season)",
                     },
+                    "include_past_projections": {
+                        "anyOf": [{"type": "boolean"}, {"type": "null"}],
+                        "description": "Also fetch Sleeper projections for weeks already played",
+                        "default": False,
+                    },
                 },
                 "required": ["league_id", "player_id"],
             },
@@ -1205,8 +1216,15 @@ inject_draft_dependencies(
 async def main():
     """Run the MCP server."""
     # Use stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        # Release pooled HTTP connections
+        from sleeper_api import sleeper_client
+
+        await close_session()
+        await sleeper_client.close()
 
 
 if __name__ == "__main__":
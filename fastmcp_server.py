@@ -7,6 +7,7 @@ This module wraps the existing Yahoo Fantasy Football tooling defined in
 ``@server.tool`` decorator so it can be deployed on fastmcp.cloud.
 """
 
+import asyncio
 import json
 import os
 from collections.abc import Iterable
@@ -17,6 +18,7 @@ from fastmcp import Context, FastMCP
 from mcp.types import ContentBlock, TextContent, ToolAnnotations
 
 import fantasy_football_multi_league
+from src.api import close_session
 
 # REMOVED: enhanced_mcp_tools imports - no longer using wrapper tools
 
@@ -63,7 +65,7 @@ _TOOL_PROMPTS: Dict[str, str] = {
     ),
     "ff_get_player_weekly_points": (
         "Track a player's week-by-week fantasy production with Sleeper projections. "
-        "Parameters: league_id (or league_key), player_id (or full player_key), optional start_week, end_week, and season."
+        "Parameters: league_id (or league_key), player_id (or full player_key), optional start_week, end_week, season, and include_past_projections."
     ),
     "ff_compare_teams": (
         "Contrast two league rosters side-by-side to evaluate trades or matchup "
@@ -490,7 +492,7 @@ async def ff_get_players(
     name="ff_get_player_weekly_points",
     description=(
         "Get a player's weekly fantasy points alongside Sleeper projections. "
-        "Parameters: league_id (or league_key), player_id (or full player_key), optional start_week, end_week, season."
+        "Parameters: league_id (or league_key), player_id (or full player_key), optional start_week, end_week, season, include_past_projections."
     ),
     meta=_tool_meta("ff_get_player_weekly_points"),
     annotations=_read_only_annotations(),
@@ -502,6 +504,7 @@ async def ff_get_player_weekly_points(
     start_week: Optional[int] = None,
     end_week: Optional[int] = None,
     season: Optional[int] = None,
+    include_past_projections: bool = False,
 ) -> Dict[str, Any]:
     """
     Retrieve per-week fantasy production for a Yahoo player with Sleeper projections.
@@ -512,6 +515,7 @@ async def ff_get_player_weekly_points(
         start_week: First week to include (defaults to Week 1)
         end_week: Final week to include (defaults to current week)
         season: Season year (defaults to current NFL season)
+        include_past_projections: Also fetch projections for weeks already played
     """
 
     return await _call_legacy_tool(
@@ -522,6 +526,7 @@ async def ff_get_player_weekly_points(
         start_week=start_week,
         end_week=end_week,
         season=season,
+        include_past_projections=include_past_projections,
     )
 
 
@@ -1730,6 +1735,14 @@ KEY DIFFERENCES VS REDRAFT:
 📊 Deeper benches = more roster management"""
 
 
+async def _close_http_sessions() -> None:
+    """Close the pooled Yahoo and Sleeper HTTP sessions on server shutdown."""
+    from sleeper_api import sleeper_client
+
+    await close_session()
+    await sleeper_client.close()
+
+
 def run_http_server(
     host: Optional[str] = None, port: Optional[int] = None, *, show_banner: bool = True
 ) -> None:
@@ -1738,12 +1751,18 @@ def run_http_server(
     resolved_host = host or os.getenv("HOST", "0.0.0.0")
     resolved_port = port or int(os.getenv("PORT", "8000"))
 
-    server.run(
-        "http",
-        host=resolved_host,
-        port=resolved_port,
-        show_banner=show_banner,
-    )
+    async def serve() -> None:
+        try:
+            await server.run_async(
+                "http",
+                host=resolved_host,
+                port=resolved_port,
+                show_banner=show_banner,
+            )
+        finally:
+            await _close_http_sessions()
+
+    asyncio.run(serve())
 
 
 def main() -> None:
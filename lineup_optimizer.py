@@ -10,6 +10,7 @@ results based purely on the roster data already returned by the legacy layer.
 
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
@@ -262,6 +263,11 @@ class Player:
     def is_valid(self) -> bool:
         return bool(self.name and self.team)
 
+    @cached_property
+    def name_key(self) -> str:
+        """Lowercased name used for case-insensitive lookups."""
+        return (self.name or "").lower()
+
 
 class LineupOptimizer:
     """Best-effort lineup helper that works entirely offline."""
@@ -7,12 +7,13 @@ No authentication required - completely free and open API
 import asyncio
 import aiohttp
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import hashlib
 import difflib
 import os
 import re
+import sys
 
 # Import caching from our yahoo utils
 from src.api.yahoo_utils import ResponseCache
@@ -22,9 +23,20 @@ class SleeperAPI:
     """Client for Sleeper's free fantasy football API."""
 
     BASE_URL = "https://api.sleeper.app/v1"
+    # Cap on simultaneous HTTP requests so concurrent lookups don't trip Sleeper throttling
+    MAX_CONCURRENT_REQUESTS = 8
+    # Retries for rate-limited (429) responses, backing off RETRY_DELAY * 2**attempt seconds
+    MAX_RETRIES = 2
+    RETRY_DELAY = 0.5
 
     def __init__(self):
         self.cache = ResponseCache()
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        # In-flight cacheable requests, keyed by endpoint
+        self._pending_requests: Dict[str, asyncio.Future] = {}
+        # Shared HTTP session (created lazily on the running event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         # Override cache TTLs for Sleeper data
         self.cache.default_ttls.update(
             {
@@ -32,7 +44,10 @@ class SleeperAPI:
                 "trending": 1800,  # 30 minutes - trending is more dynamic
                 "projections": 3600,  # 1 hour - projections update periodically
                 "stats": 300,  # 5 minutes - during games
+                "stats_final": 86400,  # 24 hours - completed weeks only see stat corrections
                 "matchups": 86400,  # 24 hours - NFL matchups are weekly
+                "expert_advice": 300,  # 5 minutes - derived from the cached data above
+                "player_map": 21600,  # 6 hours - Yahoo -> Sleeper ID matches are stable
             }
         )
 
@@ -40,8 +55,16 @@ class SleeperAPI:
         self._players_cache = None
         self._players_cache_time = None
 
-    async def _make_request(self, endpoint: str, use_cache: bool = True) -> Optional[Dict]:
-        """Make a request to Sleeper API."""
+    async def _make_request(
+        self, endpoint: str, use_cache: bool = True, ttl: Optional[int] = None
+    ) -> Optional[Dict]:
+        """Make a request to Sleeper API.
+
+        Args:
+            endpoint: Path relative to BASE_URL
+            use_cache: Serve from / store into the response cache
+            ttl: Cache TTL in seconds for this response (default: cache's own default)
+        """
         # Ensure endpoint is str
         if not isinstance(endpoint, str):
             endpoint = str(endpoint)
@@ -52,20 +75,53 @@ class SleeperAPI:
             if cached is not None:
                 return cached
 
+            # Concurrent callers for the same endpoint share a single request
+            pending = self._pending_requests.get(endpoint)
+            if pending is None:
+                pending = asyncio.ensure_future(self._fetch(endpoint, use_cache, ttl))
+                self._pending_requests[endpoint] = pending
+                pending.add_done_callback(lambda _: self._pending_requests.pop(endpoint, None))
+            return await asyncio.shield(pending)
+
+        return await self._fetch(endpoint, use_cache, ttl)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating one for the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session left over from an earlier event loop is closed, not leaked
+            await self.close()
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=64, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session (call on shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _fetch(self, endpoint: str, use_cache: bool, ttl: Optional[int]) -> Optional[Dict]:
+        """Perform the HTTP request for _make_request, caching successful responses."""
         url = f"{self.BASE_URL}/{endpoint}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
+            for attempt in range(self.MAX_RETRIES + 1):
+                session = await self._get_session()
+                async with self._request_semaphore, session.get(url) as response:
                     if response.status == 200:
                         data = await response.json()
                         # Cache successful response
                         if use_cache:
-                            await self.cache.set(endpoint, data)
+                            await self.cache.set(endpoint, data, ttl=ttl)
                         return data
-                    else:
+                    if response.status != 429 or attempt == self.MAX_RETRIES:
                         print(f"Sleeper API error {response.status} for {endpoint}")
                         return None
+                # Rate limited: back off without holding a request slot
+                await asyncio.sleep(self.RETRY_DELAY * (2**attempt))
+            return None
         except Exception as e:
             print(f"Error fetching from Sleeper: {e}")
             return None
@@ -83,12 +139,37 @@ class SleeperAPI:
 
         players = await self._make_request("players/nfl")
         if players:
+            self._intern_player_fields(players)
             self._players_cache = players
             self._players_cache_time = datetime.now()
             # Build normalized index for improved matching
             self._build_normalized_index(players)
         return players or {}
 
+    # Categorical player fields whose values repeat across the whole catalog
+    _INTERNED_PLAYER_FIELDS = ("position", "team", "status", "injury_status", "sport")
+
+    @classmethod
+    def _intern_player_fields(cls, players: Dict[str, Dict]) -> None:
+        """Share one string object per distinct categorical value in the player catalog.
+
+        JSON decoding allocates a fresh string for every value, so the ~10k player
+        entries otherwise hold thousands of copies of "WR", "KC", "Active", etc.
+        """
+        intern = sys.intern
+        for pdata in players.values():
+            if not isinstance(pdata, dict):
+                continue
+            for field in cls._INTERNED_PLAYER_FIELDS:
+                value = pdata.get(field)
+                if isinstance(value, str):
+                    pdata[field] = intern(value)
+            positions = pdata.get("fantasy_positions")
+            if isinstance(positions, list):
+                pdata["fantasy_positions"] = [
+                    intern(pos) if isinstance(pos, str) else pos for pos in positions
+                ]
+
     # ----------------------- Name Normalization Utilities ------------------
     _normalized_index: Dict[str, str] = {}
     _normalized_variants: Dict[str, List[str]] = {}
@@ -263,7 +344,9 @@ class SleeperAPI:
             limit: Number of results
         """
         endpoint = f"players/{sport}/trending/{add_drop}?lookback_hours={hours}&limit={limit}"
-        data = await self._make_request(endpoint, use_cache=True)
+        data = await self._make_request(
+            endpoint, use_cache=True, ttl=self.cache.default_ttls["trending"]
+        )
 
         if data:
             # Enrich with player names
@@ -294,6 +377,16 @@ class SleeperAPI:
         """Get current NFL season state (week, season, etc)."""
         return await self._make_request("state/nfl") or {}
 
+    async def _is_completed_week(self, season: int, week: int) -> bool:
+        """Whether a week is over (an earlier season, or before the current week)."""
+        state = await self.get_nfl_state()
+        try:
+            current_season = int(state.get("season", ""))
+            current_week = int(state.get("week", ""))
+        except (TypeError, ValueError):
+            return False
+        return season < current_season or (season == current_season and week < current_week)
+
     async def get_player_stats(self, season: int, week: int) -> Dict[str, Dict]:
         """Get actual player stats for a specific week.
 
@@ -317,7 +410,10 @@ class SleeperAPI:
             points = player_stats.get("pts_ppr", 0)
         """
         endpoint = f"stats/nfl/{season}/{week}"
-        raw = await self._make_request(endpoint, use_cache=True) or {}
+        # Completed weeks are effectively immutable, so keep them much longer
+        ttl_key = "stats_final" if await self._is_completed_week(season, week) else "stats"
+        ttl = self.cache.default_ttls[ttl_key]
+        raw = await self._make_request(endpoint, use_cache=True, ttl=ttl) or {}
 
         # Sleeper returns stats keyed by player_id
         # No additional processing needed - return raw data
@@ -335,7 +431,7 @@ class SleeperAPI:
         Returns dict keyed by player_id with projection data.
         """
         endpoint = f"projections/nfl/{season}/{week}"
-        raw = await self._make_request(endpoint) or {}
+        raw = await self._make_request(endpoint, ttl=self.cache.default_ttls["projections"]) or {}
 
         # Check if we have real projection data
         real_projections = {}
@@ -382,6 +478,34 @@ class SleeperAPI:
 
         return real_projections
 
+    async def get_player_stats_range(
+        self, season: int, start_week: int, end_week: int
+    ) -> Dict[int, Union[Dict[str, Dict], BaseException]]:
+        """Get actual player stats for every week from start_week to end_week (inclusive).
+
+        Sleeper only serves stats per week, so the weekly requests run concurrently
+        (sharing the client's cache and request cap). A week whose fetch raised maps
+        to the exception instead of its stats.
+        """
+        weeks = range(start_week, end_week + 1)
+        results = await asyncio.gather(
+            *(self.get_player_stats(season, week) for week in weeks), return_exceptions=True
+        )
+        return dict(zip(weeks, results))
+
+    async def get_projections_range(
+        self, season: int, start_week: int, end_week: int
+    ) -> Dict[int, Union[Dict[str, Dict], BaseException]]:
+        """Get player projections for every week from start_week to end_week (inclusive).
+
+        See get_player_stats_range for how the weeks are fetched and how failures are returned.
+        """
+        weeks = range(start_week, end_week + 1)
+        results = await asyncio.gather(
+            *(self.get_projections(season, week) for week in weeks), return_exceptions=True
+        )
+        return dict(zip(weeks, results))
+
     async def _create_fallback_projections(
         self, season: int, week: int, positions: Optional[List[str]] = None
     ) -> Dict[str, Dict]:
@@ -623,6 +747,21 @@ class SleeperAPI:
         Returns:
             Sleeper player_id if found (with relaxed filters)
         """
+        cache_key = f"player_map/{yahoo_name}/{position or ''}/{team or ''}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        sleeper_id = await self._match_yahoo_to_sleeper(yahoo_name, position, team)
+        # Misses aren't cached so new players resolve once Sleeper's catalog has them
+        if sleeper_id is not None:
+            await self.cache.set(cache_key, sleeper_id, ttl=self.cache.default_ttls["player_map"])
+        return sleeper_id
+
+    async def _match_yahoo_to_sleeper(
+        self, yahoo_name: str, position: Optional[str] = None, team: Optional[str] = None
+    ) -> Optional[str]:
+        """Match a Yahoo player to a Sleeper ID (uncached, see map_yahoo_to_sleeper)."""
         # Clean the Yahoo name (remove Jr., Sr., III, etc)
         clean_name = (
             yahoo_name.replace(" Jr.", "")
@@ -714,6 +853,19 @@ class SleeperAPI:
         - Trending data and momentum
         - Position-specific context
         """
+        cache_key = f"expert_advice/{player_name}/{week or 'current'}"
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        advice = await self._build_expert_advice(player_name, week)
+        await self.cache.set(cache_key, advice, ttl=self.cache.default_ttls["expert_advice"])
+        return advice
+
+    async def _build_expert_advice(
+        self, player_name: str, week: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Compute expert advice for a player (uncached, see get_expert_advice)."""
         player = await self.get_player_by_name(player_name)
         if not player:
             return {"advice": "Player not found", "confidence": 0}
@@ -948,6 +1100,26 @@ async def get_trending_adds(limit: int = 10) -> List[Dict]:
     return await sleeper_client.get_trending_players(add_drop="add", limit=limit)
 
 
+async def get_trending_adds_index(limit: int = 10) -> Tuple[List[Dict], Dict[str, Dict]]:
+    """Get top trending adds along with an index of them by lowercased name.
+
+    Both are cached together for the trending TTL so repeat callers skip
+    rebuilding the index.
+    """
+    cache_key = f"trending_index/add/{limit}"
+    cached = await sleeper_client.cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    trending = await get_trending_adds(limit)
+    index = {p["name"].lower(): p for p in trending}
+    if trending:
+        await sleeper_client.cache.set(
+            cache_key, (trending, index), ttl=sleeper_client.cache.default_ttls["trending"]
+        )
+    return trending, index
+
+
 async def get_trending_drops(limit: int = 10) -> List[Dict]:
     """Get top trending player drops."""
     return await sleeper_client.get_trending_players(add_drop="drop", limit=limit)
@@ -2,6 +2,7 @@
 
 from .yahoo_client import (
     YAHOO_API_BASE,
+    close_session,
     get_access_token,
     refresh_yahoo_token,
     set_access_token,
@@ -13,5 +14,6 @@ __all__ = [
     "refresh_yahoo_token",
     "get_access_token",
     "set_access_token",
+    "close_session",
     "YAHOO_API_BASE",
 ]
@@ -1,16 +1,31 @@
 """Yahoo Fantasy Sports API client with rate limiting and token refresh."""
 
+import asyncio
+import json
 import os
 import socket
-from typing import Dict
+from typing import Any, Callable, Dict, Optional
 
 import aiohttp
 from src.api.yahoo_utils import rate_limiter, response_cache
 
+# Use orjson for decoding large Yahoo payloads when it's installed
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Module-level token cache
 _YAHOO_ACCESS_TOKEN = os.getenv("YAHOO_ACCESS_TOKEN")
 YAHOO_API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
 
+# Shared HTTP session so API calls reuse pooled keep-alive connections
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 def get_access_token() -> str:
     """Get the current access token."""
@@ -27,6 +42,29 @@ def set_access_token(token: str) -> None:
     os.environ["YAHOO_ACCESS_TOKEN"] = token
 
 
+async def _get_session() -> aiohttp.ClientSession:
+    """Get the shared API session, creating one for the running event loop if needed."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # A session left over from an earlier event loop is closed, not leaked
+        await close_session()
+        connector = aiohttp.TCPConnector(
+            family=socket.AF_INET, limit_per_host=64, keepalive_timeout=60
+        )
+        _session = aiohttp.ClientSession(connector=connector, trust_env=True)
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared API session (call on shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
 async def yahoo_api_call(
     endpoint: str, retry_on_auth_fail: bool = True, use_cache: bool = True
 ) -> Dict:
@@ -56,30 +94,27 @@ async def yahoo_api_call(
     url = f"{YAHOO_API_BASE}/{endpoint}?format=json"
     headers = {"Authorization": f"Bearer {access_token}", "Accept": "application/json"}
 
-    connector = aiohttp.TCPConnector(family=socket.AF_INET)
-    async with aiohttp.ClientSession(connector=connector, trust_env=True) as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                data = await response.json()
-                # Cache successful response
-                if use_cache:
-                    await response_cache.set(endpoint, data)
-                return data
-            elif response.status == 401 and retry_on_auth_fail:
-                # Token expired, try to refresh
-                refresh_result = await refresh_yahoo_token()
-                if refresh_result.get("status") == "success":
-                    # Token refreshed, retry the API call with new token
-                    return await yahoo_api_call(
-                        endpoint, retry_on_auth_fail=False, use_cache=use_cache
-                    )
-                else:
-                    # Refresh failed, raise the original error
-                    text = await response.text()
-                    raise Exception(f"Yahoo API auth failed and token refresh failed: {text[:200]}")
+    session = await _get_session()
+    async with session.get(url, headers=headers) as response:
+        if response.status == 200:
+            data = await response.json(loads=_json_loads)
+            # Cache successful response
+            if use_cache:
+                await response_cache.set(endpoint, data)
+            return data
+        elif response.status == 401 and retry_on_auth_fail:
+            # Token expired, try to refresh
+            refresh_result = await refresh_yahoo_token()
+            if refresh_result.get("status") == "success":
+                # Token refreshed, retry the API call with new token
+                return await yahoo_api_call(endpoint, retry_on_auth_fail=False, use_cache=use_cache)
             else:
+                # Refresh failed, raise the original error
                 text = await response.text()
-                raise Exception(f"Yahoo API error {response.status}: {text[:200]}")
+                raise Exception(f"Yahoo API auth failed and token refresh failed: {text[:200]}")
+        else:
+            text = await response.text()
+            raise Exception(f"Yahoo API error {response.status}: {text[:200]}")
 
 
 async def refresh_yahoo_token() -> Dict:
@@ -1,5 +1,6 @@
 """Matchup MCP tool handlers."""
 
+import asyncio
 from typing import Any
 
 # These will be injected from main file
@@ -54,8 +55,10 @@ async def handle_ff_compare_teams(arguments: dict) -> dict:
     team_key_a = arguments.get("team_key_a")
     team_key_b = arguments.get("team_key_b")
 
-    data_a = await yahoo_api_call(f"team/{team_key_a}/roster")
-    data_b = await yahoo_api_call(f"team/{team_key_b}/roster")
+    data_a, data_b = await asyncio.gather(
+        yahoo_api_call(f"team/{team_key_a}/roster"),
+        yahoo_api_call(f"team/{team_key_b}/roster"),
+    )
 
     roster_a = parse_team_roster(data_a)
     roster_b = parse_team_roster(data_b)
@@ -1,12 +1,152 @@
 """Player MCP tool handlers."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import heapq
+from bisect import bisect_right
+from collections import defaultdict
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+import numpy as np
 
 # These will be injected from main file
 yahoo_api_call = None
 get_waiver_wire_players = None
 
 
+# Keys from a Yahoo response root down to its league section
+_LEAGUE_PATH = ("fantasy_content", "league")
+
+# Yahoo player payload key -> (player_info key, value converter)
+_PLAYER_FIELD_PARSERS: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "name": ("name", lambda v: v.get("full") if isinstance(v, dict) else None),
+    "editorial_team_abbr": ("team", lambda v: v),
+    "display_position": ("position", lambda v: v),
+    "ownership": (
+        "owned_pct",
+        lambda v: v.get("ownership_percentage", 0.0) if isinstance(v, dict) else 0.0,
+    ),
+    "percent_owned": ("owned_pct", lambda v: float(v or 0.0)),
+    "status": ("injury_status", lambda v: v),
+    "bye_weeks": ("bye", lambda v: v.get("week", "N/A") if isinstance(v, dict) else "N/A"),
+}
+
+
+# Yahoo player payload key -> weekly points player_info key (name is handled separately)
+_PLAYER_INFO_FIELDS: Dict[str, str] = {
+    "player_key": "player_key",
+    "player_id": "yahoo_player_id",
+    "editorial_team_abbr": "team",
+    "display_position": "position",
+}
+
+
+# Placeholder values for serialized player fields whose include_* flag is off
+_PROJECTION_FIELDS_OFF: Dict[str, Any] = dict.fromkeys(
+    ("yahoo_projection", "sleeper_projection", "floor_projection", "ceiling_projection")
+)
+_EXTERNAL_FIELDS_OFF: Dict[str, Any] = dict.fromkeys(
+    ("matchup_score", "matchup_description", "trending_score")
+)
+_ENHANCEMENT_FIELDS_OFF: Dict[str, Any] = {
+    "bye_week": None,
+    "on_bye": False,
+    "enhancement_context": None,
+    "adjusted_projection": None,
+}
+_EXPERT_FIELDS_OFF: Dict[str, Any] = dict.fromkeys(
+    ("expert_tier", "expert_recommendation", "expert_confidence", "expert_advice")
+)
+
+# Sleeper projection point fields, in order of preference
+_PROJECTION_POINT_KEYS = ("pts_ppr", "pts", "pts_std", "pts_half_ppr")
+
+# Pickup urgency: a score >= _URGENCY_THRESHOLDS[i] earns _URGENCY_LABELS[i + 1]
+_URGENCY_THRESHOLDS = (35, 50, 65, 80)
+_URGENCY_LABELS = (
+    "Avoid - Better options available",
+    "Low Priority - Depth option",
+    "Moderate - Worth a claim",
+    "High Priority - Strong pickup",
+    "MUST ADD - Elite waiver target",
+)
+
+_WAIVER_ANALYSIS_TEMPLATE = (
+    "{tier} tier player with {confidence}% confidence. "
+    "Recommendation: {recommendation}. Priority: {priority}/100 "
+    "(proj: {proj:.1f}, owned: {owned:.1f}%, trending: {trending}){scarcity}"
+)
+
+# Waiver wire feature lists, grouped by the include_* flag that enables them
+_BASE_WAIVER_FEATURES = ("Yahoo ownership and change data",)
+_EXTERNAL_WAIVER_FEATURES = ("Sleeper projections and rankings", "Matchup analysis")
+_ANALYSIS_WAIVER_FEATURES = (
+    "Expert tier classification",
+    "Waiver priority scoring",
+    "Pickup urgency assessment",
+    "Positional scarcity analysis",
+)
+# Keyed by (include_external_data, include_analysis)
+_WAIVER_FEATURES: Dict[Tuple[bool, bool], Tuple[str, ...]] = {
+    (external, analysis): _BASE_WAIVER_FEATURES
+    + (_EXTERNAL_WAIVER_FEATURES if external else ())
+    + (_ANALYSIS_WAIVER_FEATURES if analysis else ())
+    for external in (False, True)
+    for analysis in (False, True)
+}
+
+
+class _WeekEntry(TypedDict):
+    """One week of ff_get_player_weekly_points output."""
+
+    week_number: int
+    earned_points: Optional[float]
+    sleeper_projected_points: Optional[float]
+
+
+def _league_player_arrays(data: Any) -> List[List[Any]]:
+    """Collect the raw ``player`` arrays from a Yahoo league players response."""
+    league: Any = data
+    for key in _LEAGUE_PATH:
+        league = league.get(key) if isinstance(league, dict) else None
+    if not isinstance(league, list):
+        return []
+    return [
+        player_entry["player"]
+        for element in league
+        if isinstance(element, dict) and isinstance(element.get("players"), dict)
+        for entry_key, player_entry in element["players"].items()
+        if entry_key != "count"
+        and isinstance(player_entry, dict)
+        and isinstance(player_entry.get("player"), list)
+    ]
+
+
+def _index_by_name(basic_players: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index basic Yahoo player rows by lowercased name; the first occurrence wins.
+
+    Callers fall back to a defaults dict for unmatched players, so keys missing from a
+    matched row read as None rather than the defaults.
+    """
+    by_name: Dict[str, Dict[str, Any]] = {}
+    for p in basic_players:
+        by_name.setdefault((p.get("name") or "").lower(), p)
+    return by_name
+
+
+def _iter_payload_dicts(container: Any) -> List[Dict[str, Any]]:
+    """Flatten nested Yahoo payload lists into their dicts, in document order."""
+    found: List[Dict[str, Any]] = []
+    stack = [container]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            found.append(item)
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+    return found
+
+
 async def handle_ff_get_players(arguments: dict) -> dict:
     """Get top available players with optional enhanced data.
 
@@ -37,48 +177,17 @@ async def handle_ff_get_players(arguments: dict) -> dict:
     pos_filter = f";position={position}" if position else ""
     data = await yahoo_api_call(f"league/{league_key}/players;status=A{pos_filter};count={count}")
 
-    def _iter_payload_dicts(container: Any):
-        if isinstance(container, dict):
-            yield container
-        elif isinstance(container, list):
-            for item in container:
-                yield from _iter_payload_dicts(item)
-
     basic_players: list[dict[str, Any]] = []
-    league = data.get("fantasy_content", {}).get("league", [])
-    for item in league:
-        if not (isinstance(item, dict) and "players" in item):
-            continue
-        players_data = item["players"]
-        if not isinstance(players_data, dict):
-            continue
-
-        for key, player_entry in players_data.items():
-            if key == "count" or not isinstance(player_entry, dict):
-                continue
-            player_array = player_entry.get("player")
-            if not isinstance(player_array, list):
-                continue
-
-            player_info: dict[str, Any] = {}
-            for payload in _iter_payload_dicts(player_array):
-                if "name" in payload and isinstance(payload["name"], dict):
-                    player_info["name"] = payload["name"].get("full")
-                if "editorial_team_abbr" in payload:
-                    player_info["team"] = payload["editorial_team_abbr"]
-                if "display_position" in payload:
-                    player_info["position"] = payload["display_position"]
-                if "ownership" in payload and isinstance(payload["ownership"], dict):
-                    player_info["owned_pct"] = payload["ownership"].get("ownership_percentage", 0.0)
-                if "percent_owned" in payload:
-                    player_info["owned_pct"] = float(payload.get("percent_owned", 0.0))
-                # Add injury, bye as in waiver
-                if "status" in payload:
-                    player_info["injury_status"] = payload["status"]
-                if "bye_weeks" in payload:
-                    player_info["bye"] = payload["bye_weeks"].get("week", "N/A")
-            if player_info:
-                basic_players.append(player_info)
+    for player_array in _league_player_arrays(data):
+        player_info: dict[str, Any] = {}
+        for payload in _iter_payload_dicts(player_array):
+            for field, value in payload.items():
+                parser = _PLAYER_FIELD_PARSERS.get(field)
+                if parser is not None:
+                    target, convert = parser
+                    player_info[target] = convert(value)
+        if player_info:
+            basic_players.append(player_info)
 
     result = {
         "status": "success",
@@ -111,60 +220,52 @@ async def handle_ff_get_players(arguments: dict) -> dict:
                 enhanced_players, week=week
             )
 
+            basic_by_name = _index_by_name(basic_players)
+
             def serialize_free_agent_player(player: Player) -> Dict[str, Any]:
+                basic = basic_by_name.get(player.name_key, {"bye": "N/A"})
                 base = {
                     "name": player.name,
                     "position": player.position,
                     "team": player.team,
                     "opponent": player.opponent or "N/A",
                     "status": "Available",
-                    "yahoo_projection": player.yahoo_projection if include_projections else None,
-                    "sleeper_projection": (
-                        player.sleeper_projection if include_projections else None
-                    ),
                     "sleeper_id": player.sleeper_id,
                     "sleeper_match_method": player.sleeper_match_method,
-                    "floor_projection": player.floor_projection if include_projections else None,
-                    "ceiling_projection": (
-                        player.ceiling_projection if include_projections else None
-                    ),
                     "consistency_score": player.consistency_score,
                     "player_tier": player.player_tier,
-                    "matchup_score": player.matchup_score if include_external_data else None,
-                    "matchup_description": (
-                        player.matchup_description if include_external_data else None
-                    ),
-                    "trending_score": player.trending_score if include_external_data else None,
                     "risk_level": player.risk_level,
-                    "owned_pct": next(
-                        (
-                            p.get("owned_pct") or 0
-                            for p in basic_players
-                            if p.get("name", "").lower() == player.name.lower()
-                        ),
-                        0,
-                    ),
-                    "injury_status": getattr(player, "injury_status", "Healthy"),
-                    "bye": next(
-                        (
-                            p.get("bye")
-                            for p in basic_players
-                            if p.get("name", "").lower() == player.name.lower()
-                        ),
-                        "N/A",
-                    ),
-                    # Enhancement layer fields
-                    "bye_week": player.bye if include_external_data else None,
-                    "on_bye": player.on_bye if include_external_data else False,
-                    "performance_flags": player.performance_flags if include_external_data else [],
-                    "enhancement_context": (
-                        player.enhancement_context if include_external_data else None
-                    ),
-                    "adjusted_projection": (
-                        player.adjusted_projection if include_external_data else None
-                    ),
+                    "owned_pct": basic.get("owned_pct") or 0,
+                    "injury_status": player.injury_status,
+                    "bye": basic.get("bye"),
                 }
 
+                if include_projections:
+                    base.update(
+                        yahoo_projection=player.yahoo_projection,
+                        sleeper_projection=player.sleeper_projection,
+                        floor_projection=player.floor_projection,
+                        ceiling_projection=player.ceiling_projection,
+                    )
+                else:
+                    base.update(_PROJECTION_FIELDS_OFF)
+
+                if include_external_data:
+                    base.update(
+                        matchup_score=player.matchup_score,
+                        matchup_description=player.matchup_description,
+                        trending_score=player.trending_score,
+                        # Enhancement layer fields
+                        bye_week=player.bye,
+                        on_bye=player.on_bye,
+                        performance_flags=player.performance_flags,
+                        enhancement_context=player.enhancement_context,
+                        adjusted_projection=player.adjusted_projection,
+                    )
+                else:
+                    base.update(_EXTERNAL_FIELDS_OFF)
+                    base.update(_ENHANCEMENT_FIELDS_OFF, performance_flags=[])
+
                 # Add analysis if flagged
                 if include_analysis:
                     proj = (player.yahoo_projection or 0) + (player.sleeper_projection or 0)
@@ -193,17 +294,24 @@ async def handle_ff_get_players(arguments: dict) -> dict:
 
                 return base
 
-            enhanced_list = [
-                serialize_free_agent_player(p) for p in enhanced_players if p.is_valid()
-            ]
-            if include_analysis:
-                enhanced_list.sort(key=lambda x: x.get("free_agent_value", 0), reverse=True)
-            elif include_projections:
-                enhanced_list.sort(
-                    key=lambda x: (x.get("sleeper_projection") or 0)
-                    + (x.get("yahoo_projection") or 0),
-                    reverse=True,
-                )
+            # Serialize, keeping each player's sort score alongside its payload
+            scored: List[Tuple[float, Dict[str, Any]]] = []
+            for player in enhanced_players:
+                if not player.is_valid():
+                    continue
+                base = serialize_free_agent_player(player)
+                if include_analysis:
+                    sort_score = base["free_agent_value"]
+                elif include_projections:
+                    sort_score = (player.sleeper_projection or 0) + (player.yahoo_projection or 0)
+                else:
+                    sort_score = 0.0
+                scored.append((sort_score, base))
+
+            # Sort by free agent value or projection if analysis/projections
+            if include_analysis or include_projections:
+                scored.sort(key=itemgetter(0), reverse=True)
+            enhanced_list = [base for _, base in scored]
 
             result.update(
                 {
@@ -248,8 +356,10 @@ async def handle_ff_compare_teams(arguments: dict) -> dict:
     team_key_a = arguments.get("team_key_a")
     team_key_b = arguments.get("team_key_b")
 
-    data_a = await yahoo_api_call(f"team/{team_key_a}/roster")
-    data_b = await yahoo_api_call(f"team/{team_key_b}/roster")
+    data_a, data_b = await asyncio.gather(
+        yahoo_api_call(f"team/{team_key_a}/roster"),
+        yahoo_api_call(f"team/{team_key_b}/roster"),
+    )
 
     roster_a = parse_team_roster(data_a)
     roster_b = parse_team_roster(data_b)
@@ -341,11 +451,14 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
 
     try:
         from lineup_optimizer import lineup_optimizer, Player
-        from sleeper_api import get_trending_adds, sleeper_client
+        from sleeper_api import get_trending_adds_index, sleeper_client
     except ImportError as exc:
         result["note"] = f"Enhanced data unavailable: {exc}"
         return result
 
+    # Trending adds don't depend on the roster parse, so fetch them in the background
+    trending_task = asyncio.create_task(get_trending_adds_index(count))
+
     try:
         # Create payload for optimizer (mimic roster format)
         optimizer_payload = {
@@ -361,93 +474,81 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
 
             # Add expert advice for waiver wire analysis
             if include_analysis:
-                for player in enhanced_players:
-                    try:
-                        expert_advice = await sleeper_client.get_expert_advice(player.name, week)
-                        player.expert_tier = expert_advice.get("tier", "Depth")
-                        player.expert_recommendation = expert_advice.get("recommendation", "Bench")
-                        player.expert_confidence = expert_advice.get("confidence", 50)
-                        player.expert_advice = expert_advice.get("advice", "No analysis available")
-                    except Exception:
+                # Players are independent, so fetch their advice concurrently
+                advice_results = await asyncio.gather(
+                    *(sleeper_client.get_expert_advice(p.name, week) for p in enhanced_players),
+                    return_exceptions=True,
+                )
+                for player, expert_advice in zip(enhanced_players, advice_results):
+                    if not isinstance(expert_advice, dict):
                         # Continue with default values if expert advice fails
                         player.expert_tier = "Depth"
                         player.expert_recommendation = "Monitor"
                         player.expert_confidence = 50
-                        player.expert_advice = f"Expert analysis unavailable"
+                        player.expert_advice = "Expert analysis unavailable"
+                        continue
+                    player.expert_tier = expert_advice.get("tier", "Depth")
+                    player.expert_recommendation = expert_advice.get("recommendation", "Bench")
+                    player.expert_confidence = expert_advice.get("confidence", 50)
+                    player.expert_advice = expert_advice.get("advice", "No analysis available")
 
-            # Fetch and merge trending data
-            trending = await get_trending_adds(count)
-            trending_dict = {p["name"].lower(): p for p in trending}
+            # Merge trending data
+            trending, trending_dict = await trending_task
+
+            basic_by_name = _index_by_name(basic_players)
 
             def serialize_waiver_player(player: Player) -> Dict[str, Any]:
+                basic = basic_by_name.get(player.name_key, {"bye": "N/A", "weekly_change": 0})
                 base = {
                     "name": player.name,
                     "position": player.position,
                     "team": player.team,
                     "opponent": player.opponent or "N/A",
-                    "status": getattr(player, "status", "Available"),
-                    "yahoo_projection": player.yahoo_projection if include_projections else None,
-                    "sleeper_projection": (
-                        player.sleeper_projection if include_projections else None
-                    ),
+                    "status": player.status,
                     "sleeper_id": player.sleeper_id,
                     "sleeper_match_method": player.sleeper_match_method,
-                    "floor_projection": player.floor_projection if include_projections else None,
-                    "ceiling_projection": (
-                        player.ceiling_projection if include_projections else None
-                    ),
                     "consistency_score": player.consistency_score,
                     "player_tier": player.player_tier,
-                    "matchup_score": player.matchup_score if include_external_data else None,
-                    "matchup_description": (
-                        player.matchup_description if include_external_data else None
-                    ),
-                    "trending_score": player.trending_score if include_external_data else None,
                     "risk_level": player.risk_level,
-                    "owned_pct": next(
-                        (
-                            p.get("owned_pct") or 0.0
-                            for p in basic_players
-                            if p.get("name", "").lower() == player.name.lower()
-                        ),
-                        0.0,
-                    ),
-                    "weekly_change": next(
-                        (
-                            p.get("weekly_change")
-                            for p in basic_players
-                            if p.get("name", "").lower() == player.name.lower()
-                        ),
-                        0,
-                    ),
-                    "injury_status": getattr(player, "injury_status", "Healthy"),
-                    "bye": next(
-                        (
-                            p.get("bye")
-                            for p in basic_players
-                            if p.get("name", "").lower() == player.name.lower()
-                        ),
-                        "N/A",
-                    ),
-                    # Expert advice fields
-                    "expert_tier": (
-                        getattr(player, "expert_tier", None) if include_analysis else None
-                    ),
-                    "expert_recommendation": (
-                        getattr(player, "expert_recommendation", None) if include_analysis else None
-                    ),
-                    "expert_confidence": (
-                        getattr(player, "expert_confidence", None) if include_analysis else None
-                    ),
-                    "expert_advice": (
-                        getattr(player, "expert_advice", None) if include_analysis else None
-                    ),
+                    "owned_pct": basic.get("owned_pct") or 0.0,
+                    "weekly_change": basic.get("weekly_change"),
+                    "injury_status": player.injury_status,
+                    "bye": basic.get("bye"),
                 }
 
+                if include_projections:
+                    base.update(
+                        yahoo_projection=player.yahoo_projection,
+                        sleeper_projection=player.sleeper_projection,
+                        floor_projection=player.floor_projection,
+                        ceiling_projection=player.ceiling_projection,
+                    )
+                else:
+                    base.update(_PROJECTION_FIELDS_OFF)
+
+                if include_external_data:
+                    base.update(
+                        matchup_score=player.matchup_score,
+                        matchup_description=player.matchup_description,
+                        trending_score=player.trending_score,
+                    )
+                else:
+                    base.update(_EXTERNAL_FIELDS_OFF)
+
+                # Expert advice fields
+                if include_analysis:
+                    base.update(
+                        expert_tier=player.expert_tier,
+                        expert_recommendation=player.expert_recommendation,
+                        expert_confidence=player.expert_confidence,
+                        expert_advice=player.expert_advice,
+                    )
+                else:
+                    base.update(_EXPERT_FIELDS_OFF)
+
                 # Merge trending
-                name_lower = player.name.lower()
-                if name_lower in trending_dict:
-                    trend = trending_dict[name_lower]
+                if player.name_key in trending_dict:
+                    trend = trending_dict[player.name_key]
                     base["trending_count"] = trend.get("count", 0)
                     base["trending_position"] = trend.get("position")
 
@@ -457,82 +558,90 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
             position_scarcity = {}
             if include_analysis:
                 try:
-                    # Simple scarcity analysis based on ownership and position
-                    position_counts = {}
-
+                    # Simple scarcity analysis: [available count, ownership sum] per position
+                    position_counts: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
                     for p in basic_players:
-                        pos = p.get("position", "Unknown")
-                        owned = p.get("owned_pct", 0.0)
-
-                        if pos not in position_counts:
-                            position_counts[pos] = {"total": 0, "owned_sum": 0}
-
-                        position_counts[pos]["total"] += 1
-                        position_counts[pos]["owned_sum"] += owned
-
-                    # Calculate scarcity scores
-                    for pos, data in position_counts.items():
-                        avg_owned = data["owned_sum"] / data["total"] if data["total"] > 0 else 0
-                        # Higher average ownership = more scarcity
-                        scarcity_score = min(avg_owned / 10, 10)  # 0-10 scale
-                        position_scarcity[pos] = {
-                            "scarcity_score": round(scarcity_score, 1),
-                            "avg_ownership": round(avg_owned, 1),
-                            "available_count": data["total"],
+                        counts = position_counts[p.get("position", "Unknown")]
+                        counts[0] += 1
+                        counts[1] += p.get("owned_pct") or 0.0
+
+                    # Higher average ownership = more scarcity (0-10 scale)
+                    position_scarcity = {
+                        pos: {
+                            "scarcity_score": round(min(owned_sum / total / 10, 10), 1),
+                            "avg_ownership": round(owned_sum / total, 1),
+                            "available_count": total,
                         }
+                        for pos, (total, owned_sum) in position_counts.items()
+                    }
                 except Exception:
                     # If scarcity analysis fails, continue without it
                     pass
 
-            # Serialize enhanced players with analysis
-            enhanced_list = []
-            for player in enhanced_players:
-                if not player.is_valid():
-                    continue
+            # Serialize valid enhanced players
+            serialized = [(p, serialize_waiver_player(p)) for p in enhanced_players if p.is_valid()]
 
-                # Create serialized player data
-                base = serialize_waiver_player(player)
-
-                # Add waiver-specific analysis if flagged
-                if include_analysis:
-                    # Calculate comprehensive waiver priority score
-                    expert_confidence = getattr(player, "expert_confidence", 50)
-                    proj = (player.yahoo_projection or 0) + (player.sleeper_projection or 0)
-                    trend_score = base.get("trending_count", 0)
-                    owned = base.get("owned_pct", 0.0)
+            # Pair each payload with its sort score
+            scored: List[Tuple[float, Dict[str, Any]]] = []
+            if include_analysis:
+                # Calculate comprehensive waiver priority scores for all players at once
+                n = len(serialized)
+                confidences = np.fromiter((p.expert_confidence for p, _ in serialized), float, n)
+                projections = np.fromiter(
+                    (
+                        (p.yahoo_projection or 0) + (p.sleeper_projection or 0)
+                        for p, _ in serialized
+                    ),
+                    float,
+                    n,
+                )
+                owned_pcts = np.fromiter((b.get("owned_pct", 0.0) for _, b in serialized), float, n)
+                trend_scores = np.fromiter(
+                    (b.get("trending_count", 0) for _, b in serialized), float, n
+                )
+                scarcities = np.fromiter(
+                    (
+                        position_scarcity.get(p.position, {}).get("scarcity_score", 0)
+                        for p, _ in serialized
+                    ),
+                    float,
+                    n,
+                )
 
-                    # Position scarcity bonus (0-5 points)
-                    pos_scarcity = position_scarcity.get(player.position, {}).get(
-                        "scarcity_score", 0
-                    )
-                    scarcity_bonus = min(pos_scarcity * 0.5, 5)
+                # Position scarcity bonus (0-5 points)
+                scarcity_bonuses = np.minimum(scarcities * 0.5, 5)
 
-                    # Waiver-specific scoring algorithm
+                # Waiver-specific scoring algorithm
+                waiver_priorities = (
                     # Base score from expert confidence (35% weight, reduced to add scarcity)
-                    confidence_score = expert_confidence * 0.35
-
-                    # Projection score (30% weight)
-                    projection_score = min(proj * 2, 30)  # Cap at 30 points
-
+                    confidences * 0.35
+                    # Projection score (30% weight), capped at 30 points
+                    + np.minimum(projections * 2, 30)
                     # Ownership bonus - lower ownership = higher priority (20% weight)
-                    ownership_bonus = max(0, (50 - owned) * 0.4)  # Max 20 points for 0% owned
-
-                    # Trending bonus (10% weight)
-                    trending_bonus = min(trend_score * 1.5, 10)  # Cap at 10 points
-
-                    # Final waiver priority score
-                    waiver_priority = (
-                        confidence_score
-                        + projection_score
-                        + ownership_bonus
-                        + trending_bonus
-                        + scarcity_bonus
-                    )
+                    # Max 20 points for 0% owned
+                    + np.maximum(0, (50 - owned_pcts) * 0.4)
+                    # Trending bonus (10% weight), capped at 10 points
+                    + np.minimum(trend_scores * 1.5, 10)
+                    + scarcity_bonuses
+                )
+                # Boost urgency for scarce positions
+                urgency_thresholds = waiver_priorities + scarcity_bonuses * 2
+
+                for (player, base), waiver_priority, urgency_threshold, proj, pos_scarcity in zip(
+                    serialized,
+                    waiver_priorities.tolist(),
+                    urgency_thresholds.tolist(),
+                    projections.tolist(),
+                    scarcities.tolist(),
+                ):
                     base["waiver_priority"] = round(waiver_priority, 1)
+                    expert_confidence = player.expert_confidence
+                    trend_score = base.get("trending_count", 0)
+                    owned = base.get("owned_pct", 0.0)
 
                     # Enhanced analysis explanation
-                    expert_tier = getattr(player, "expert_tier", "Unknown")
-                    expert_rec = getattr(player, "expert_recommendation", "Monitor")
+                    expert_tier = player.expert_tier
+                    expert_rec = player.expert_recommendation
 
                     # Add scarcity context to analysis
                     scarcity_text = ""
@@ -541,43 +650,42 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
                     elif pos_scarcity > 4:
                         scarcity_text = f" Moderate scarcity at {player.position}."
 
-                    base["analysis"] = (
-                        f"{expert_tier} tier player with {expert_confidence}% confidence. "
-                        f"Recommendation: {expert_rec}. Priority: {base['waiver_priority']}/100 "
-                        f"(proj: {proj:.1f}, owned: {owned:.1f}%, trending: {trend_score}){scarcity_text}"
+                    base["analysis"] = _WAIVER_ANALYSIS_TEMPLATE.format(
+                        tier=expert_tier,
+                        confidence=expert_confidence,
+                        recommendation=expert_rec,
+                        priority=base["waiver_priority"],
+                        proj=proj,
+                        owned=owned,
+                        trending=trend_score,
+                        scarcity=scarcity_text,
                     )
 
                     # Add pickup urgency classification (adjusted for scarcity)
-                    urgency_threshold = waiver_priority + (
-                        scarcity_bonus * 2
-                    )  # Boost urgency for scarce positions
-                    if urgency_threshold >= 80:
-                        base["pickup_urgency"] = "MUST ADD - Elite waiver target"
-                    elif urgency_threshold >= 65:
-                        base["pickup_urgency"] = "High Priority - Strong pickup"
-                    elif urgency_threshold >= 50:
-                        base["pickup_urgency"] = "Moderate - Worth a claim"
-                    elif urgency_threshold >= 35:
-                        base["pickup_urgency"] = "Low Priority - Depth option"
-                    else:
-                        base["pickup_urgency"] = "Avoid - Better options available"
+                    base["pickup_urgency"] = _URGENCY_LABELS[
+                        bisect_right(_URGENCY_THRESHOLDS, urgency_threshold)
+                    ]
 
                     # Add position context
                     base["position_context"] = position_scarcity.get(
                         player.position,
                         {"scarcity_score": 0, "avg_ownership": 0, "available_count": 0},
                     )
-
-                enhanced_list.append(base)
-            # Sort by waiver_priority or projection if analysis/projections
-            if include_analysis:
-                enhanced_list.sort(key=lambda x: x.get("waiver_priority", 0), reverse=True)
+                    scored.append((base["waiver_priority"], base))
             elif include_projections:
-                enhanced_list.sort(
-                    key=lambda x: (x.get("sleeper_projection") or 0)
-                    + (x.get("yahoo_projection") or 0),
-                    reverse=True,
-                )
+                scored = [
+                    ((p.sleeper_projection or 0) + (p.yahoo_projection or 0), base)
+                    for p, base in serialized
+                ]
+            else:
+                scored = [(0.0, base) for _, base in serialized]
+
+            # Rank by waiver_priority or projection if analysis/projections
+            if include_analysis or include_projections:
+                top = heapq.nlargest(count, scored, key=itemgetter(0))
+            else:
+                top = scored
+            enhanced_list = [base for _, base in top]
 
             result.update(
                 {
@@ -590,15 +698,9 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
                             "analysis": include_analysis,
                             "expert_advice": include_analysis,  # Expert advice tied to analysis flag
                         },
-                        "features": [
-                            "Yahoo ownership and change data",
-                            "Sleeper projections and rankings" if include_external_data else None,
-                            "Matchup analysis" if include_external_data else None,
-                            "Expert tier classification" if include_analysis else None,
-                            "Waiver priority scoring" if include_analysis else None,
-                            "Pickup urgency assessment" if include_analysis else None,
-                            "Positional scarcity analysis" if include_analysis else None,
-                        ],
+                        "features": list(
+                            _WAIVER_FEATURES[(bool(include_external_data), bool(include_analysis))]
+                        ),
                         "algorithm": (
                             {
                                 "waiver_priority_weights": {
@@ -622,10 +724,109 @@ async def handle_ff_get_waiver_wire(arguments: dict) -> dict:
             result["note"] = "No players could be enhanced"
     except Exception as exc:
         result["note"] = f"Enhancement failed: {exc}. Using basic data."
+    finally:
+        # No-op once awaited; stops the fetch if enhancement bailed out early
+        trending_task.cancel()
 
     return result
 
 
+def _normalize_player_key(raw: str) -> str:
+    """Expand a bare numeric Yahoo player ID into an NFL player_key."""
+    if "." in raw:
+        return raw
+    if raw.isdigit():
+        return f"nfl.p.{raw}"
+    return raw
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """Convert a Sleeper numeric field to float, or None if it is not numeric."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _round_or_none(value: Optional[float]) -> Optional[float]:
+    """Round a point total to two decimals, passing None through."""
+    if value is None:
+        return None
+    try:
+        return round(float(value), 2)
+    except (TypeError, ValueError):
+        return None
+
+
+def _extract_earned_points(player_stats: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Pull earned fantasy points (PPR, else standard) from a Sleeper stats entry."""
+    if not isinstance(player_stats, dict):
+        return None
+    return _safe_float(player_stats.get("pts_ppr")) or _safe_float(player_stats.get("pts"))
+
+
+def _extract_projection_points(projection: Optional[Dict[str, Any]]) -> Optional[float]:
+    """Pull projected fantasy points from a Sleeper projection entry."""
+    if not isinstance(projection, dict):
+        return None
+
+    for key in _PROJECTION_POINT_KEYS:
+        val = _safe_float(projection.get(key))
+        if val is not None:
+            return val
+
+    stats_block = projection.get("projected_stats")
+    if isinstance(stats_block, list):
+        points = [
+            val
+            for stat in stats_block
+            if isinstance(stat, dict)
+            if (val := _safe_float(stat.get("pts_ppr") or stat.get("pts"))) is not None
+        ]
+        if points:
+            return sum(points)
+    elif isinstance(stats_block, dict):
+        val = _safe_float(stats_block.get("pts_ppr") or stats_block.get("pts"))
+        if val is not None:
+            return val
+
+    return None
+
+
+def _parse_int(value: Any, default: Optional[int] = None) -> Optional[int]:
+    """Parse an optional integer argument, falling back to default."""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _extract_player_info(payload: Dict[str, Any], player_key: str) -> Optional[Dict[str, Any]]:
+    """Find the requested player's identity fields in a Yahoo league players response."""
+    for player_array in _league_player_arrays(payload):
+        payloads = _iter_payload_dicts(player_array)
+        info: Dict[str, Any] = {"player_key": player_key}
+        info.update(
+            (_PLAYER_INFO_FIELDS[key], value)
+            for item in payloads
+            for key, value in item.items()
+            if key in _PLAYER_INFO_FIELDS
+        )
+        for item in payloads:
+            name = item.get("name")
+            if isinstance(name, dict) and name.get("full"):
+                info["name"] = name["full"]
+        if info.get("name"):
+            return info
+    return None
+
+
 async def handle_ff_get_player_weekly_points(arguments: dict) -> dict:
     """Fetch per-week fantasy production and projections for a Yahoo player."""
 
@@ -641,6 +842,7 @@ async def handle_ff_get_player_weekly_points(arguments: dict) -> dict:
     start_week_raw = arguments.get("start_week")
     end_week_raw = arguments.get("end_week")
     season_raw = arguments.get("season")
+    include_past_projections = arguments.get("include_past_projections", False)
 
     if not league_input:
         return {
@@ -677,61 +879,6 @@ async def handle_ff_get_player_weekly_points(arguments: dict) -> dict:
             return f"nfl.l.{raw}"
         return raw
 
-    def _normalize_player_key(raw: str) -> str:
-        if "." in raw:
-            return raw
-        if raw.isdigit():
-            return f"nfl.p.{raw}"
-        return raw
-
-    def _safe_float(value: Any) -> Optional[float]:
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            try:
-                return float(value)
-            except ValueError:
-                return None
-        return None
-
-    def _round_or_none(value: Optional[float]) -> Optional[float]:
-        if value is None:
-            return None
-        try:
-            return round(float(value), 2)
-        except (TypeError, ValueError):
-            return None
-
-    def _extract_projection_points(projection: Dict[str, Any]) -> Optional[float]:
-        if not isinstance(projection, dict):
-            return None
-
-        for key in ("pts_ppr", "pts", "pts_std", "pts_half_ppr"):
-            val = _safe_float(projection.get(key))
-            if val is not None:
-                return val
-
-        stats_block = projection.get("projected_stats")
-        if isinstance(stats_block, list):
-            total = 0.0
-            found = False
-            for stat in stats_block:
-                if not isinstance(stat, dict):
-                    continue
-                stat_val = _safe_float(stat.get("pts_ppr") or stat.get("pts"))
-                if stat_val is None:
-                    continue
-                total += stat_val
-                found = True
-            if found:
-                return total
-        elif isinstance(stats_block, dict):
-            val = _safe_float(stats_block.get("pts_ppr") or stats_block.get("pts"))
-            if val is not None:
-                return val
-
-        return None
-
     league_key = await _resolve_league_key(league_input)
     player_key = _normalize_player_key(player_input)
 
@@ -746,39 +893,7 @@ async def handle_ff_get_player_weekly_points(arguments: dict) -> dict:
             "message": f"Failed to fetch player details from Yahoo: {exc}",
         }
 
-    def _extract_player_info(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        league_section = payload.get("fantasy_content", {}).get("league", [])
-        for element in league_section:
-            if not isinstance(element, dict) or "players" not in element:
-                continue
-            players_section = element["players"]
-            if not isinstance(players_section, dict):
-                continue
-            for entry_key, player_entry in players_section.items():
-                if entry_key == "count" or not isinstance(player_entry, dict):
-                    continue
-                player_array = player_entry.get("player")
-                if not isinstance(player_array, list):
-                    continue
-                info: Dict[str, Any] = {"player_key": player_key}
-                for item in player_array:
-                    if not isinstance(item, dict):
-                        continue
-                    if "player_key" in item:
-                        info["player_key"] = item["player_key"]
-                    if "player_id" in item:
-                        info["yahoo_player_id"] = item["player_id"]
-                    if "name" in item and isinstance(item["name"], dict):
-                        info["name"] = item["name"].get("full") or info.get("name")
-                    if "editorial_team_abbr" in item:
-                        info["team"] = item["editorial_team_abbr"]
-                    if "display_position" in item:
-                        info["position"] = item["display_position"]
-                if info.get("name"):
-                    return info
-        return None
-
-    player_info = _extract_player_info(player_payload)
+    player_info = _extract_player_info(player_payload, player_key)
     if not player_info:
         return {
             "status": "error",
@@ -820,17 +935,10 @@ async def handle_ff_get_player_weekly_points(arguments: dict) -> dict:
             ),
         }
 
-    def _parse_int(value: Any, default: Optional[int] = None) -> Optional[int]:
-        if value is None:
-            return default
-        try:
-            return int(value)
-        except (TypeError, ValueError):
-            return default
-
+    current_season = await get_current_season()
     season = _parse_int(season_raw)
     if season is None:
-        season = await get_current_season()
+        season = current_season
 
     current_week = await get_current_week()
     start_week = max(_parse_int(start_week_raw, 1) or 1, 1)
@@ -840,40 +948,57 @@ async def handle_ff_get_player_weekly_points(arguments: dict) -> dict:
     else:
         end_week = min(max(current_week, start_week), 18)
 
-    weekly_results: List[Dict[str, Any]] = []
-    warnings: List[str] = []
     sleeper_key = str(sleeper_id)
+    # Sleeper payloads are keyed by string IDs; only fall back to the raw ID if it differs
+    lookup_keys = (sleeper_key,) if sleeper_id == sleeper_key else (sleeper_key, sleeper_id)
 
-    for week in range(start_week, end_week + 1):
-        week_entry: Dict[str, Any] = {"week_number": week}
+    def _pick(payload: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(payload, dict):
+            return None
+        for key in lookup_keys:
+            value = payload.get(key)
+            if value is not None:
+                return value if isinstance(value, dict) else None
+        return None
 
-        earned_points: Optional[float] = None
-        try:
-            stats_payload = await sleeper_client.get_player_stats(season, week)
-            if isinstance(stats_payload, dict):
-                player_stats = stats_payload.get(sleeper_key) or stats_payload.get(sleeper_id)
-                if isinstance(player_stats, dict):
-                    earned_points = _safe_float(
-                        player_stats.get("pts_ppr")
-                    ) or _safe_float(player_stats.get("pts"))
-        except Exception as exc:
-            warnings.append(f"Week {week}: Sleeper stats unavailable ({exc})")
-
-        projection_points: Optional[float] = None
-        try:
-            projections_payload = await sleeper_client.get_projections(season, week)
-            if isinstance(projections_payload, dict):
-                player_projection = projections_payload.get(sleeper_key) or projections_payload.get(
-                    sleeper_id
-                )
-                if isinstance(player_projection, dict):
-                    projection_points = _extract_projection_points(player_projection)
-        except Exception as exc:
-            warnings.append(f"Week {week}: Sleeper projections unavailable ({exc})")
-
-        week_entry["earned_points"] = _round_or_none(earned_points)
-        week_entry["sleeper_projected_points"] = _round_or_none(projection_points)
-        weekly_results.append(week_entry)
+    if start_week > 18 or season > current_season:
+        # No regular-season weeks in range, or a season Sleeper has no data for yet
+        weekly_payloads = []
+    else:
+        # Projections for weeks already played are skipped unless requested
+        if include_past_projections:
+            projection_start = start_week
+        elif season < current_season:
+            projection_start = end_week + 1
+        else:
+            projection_start = max(start_week, current_week)
+
+        # Fetch the stats and projections ranges concurrently
+        stats_by_week, projections_by_week = await asyncio.gather(
+            sleeper_client.get_player_stats_range(season, start_week, end_week),
+            sleeper_client.get_projections_range(season, projection_start, end_week),
+        )
+        weekly_payloads = [
+            (week, stats_by_week.get(week), projections_by_week.get(week))
+            for week in range(start_week, end_week + 1)
+        ]
+
+    weekly_results: List[_WeekEntry] = [
+        {
+            "week_number": week,
+            "earned_points": _round_or_none(_extract_earned_points(_pick(stats_payload))),
+            "sleeper_projected_points": _round_or_none(
+                _extract_projection_points(_pick(projections_payload))
+            ),
+        }
+        for week, stats_payload, projections_payload in weekly_payloads
+    ]
+    warnings = [
+        f"Week {week}: Sleeper {label} unavailable ({payload})"
+        for week, stats_payload, projections_payload in weekly_payloads
+        for label, payload in (("stats", stats_payload), ("projections", projections_payload))
+        if isinstance(payload, Exception)
+    ]
 
     result = {
         "status": "success",
@@ -1,8 +1,9 @@
 """Pytest configuration and shared fixtures for all tests."""
 
+import asyncio
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -189,6 +190,30 @@ def mock_yahoo_free_agents_response() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def make_yahoo_league_players_response() -> Callable[..., Dict[str, Any]]:
+    """Factory for Yahoo league players responses.
+
+    Each argument is one player's raw ``player`` array; with none, the response
+    holds a single minimal player named "A".
+    """
+
+    def make(*player_arrays: List[Any]) -> Dict[str, Any]:
+        if not player_arrays:
+            player_arrays = ([[{"player_key": "461.p.1"}, {"name": {"full": "A"}}]],)
+        players: Dict[str, Any] = {
+            str(index): {"player": player_array} for index, player_array in enumerate(player_arrays)
+        }
+        players["count"] = len(player_arrays)
+        return {
+            "fantasy_content": {
+                "league": [{"league_key": "461.l.61410"}, {"players": players}],
+            }
+        }
+
+    return make
+
+
 @pytest.fixture
 def mock_yahoo_standings_response() -> Dict[str, Any]:
     """Mock Yahoo API response for league standings."""
@@ -277,6 +302,14 @@ def mock_response_cache():
     return cache
 
 
+@pytest.fixture(autouse=True)
+def reset_yahoo_session(monkeypatch):
+    """Start each test without a shared Yahoo HTTP session, so patched sessions don't leak."""
+    from src.api import yahoo_client
+
+    monkeypatch.setattr(yahoo_client, "_session", None)
+
+
 @pytest.fixture
 def sample_roster_data() -> list:
     """Sample parsed roster data for testing."""
@@ -334,3 +367,56 @@ def mock_aiohttp_session():
     mock_session.post = MagicMock(return_value=mock_response)
 
     return mock_session
+
+
+@pytest.fixture
+def fake_aiohttp_session():
+    """Factory for fake aiohttp.ClientSession classes to patch into HTTP clients.
+
+    ``make(statuses=(200,), delay=0.0, json_data=None)`` returns a session class whose
+    responses use ``statuses`` in order (the last one repeats) and hold their connection
+    for ``delay`` seconds. The class records requested ``urls``, created ``instances``,
+    and the current and peak number of responses ``in_flight``.
+    """
+
+    def make(statuses: Iterable[int] = (200,), delay: float = 0.0, json_data: Optional[Any] = None):
+        pending = list(statuses)
+
+        class FakeResponse:
+            def __init__(self, status: int):
+                self.status = status
+
+            async def __aenter__(self):
+                FakeSession.in_flight += 1
+                FakeSession.peak_in_flight = max(FakeSession.peak_in_flight, FakeSession.in_flight)
+                if delay:
+                    await asyncio.sleep(delay)
+                return self
+
+            async def __aexit__(self, *args):
+                FakeSession.in_flight -= 1
+
+            async def json(self, **kwargs):
+                return {"ok": True} if json_data is None else json_data
+
+        class FakeSession:
+            urls: List[str] = []
+            instances: List["FakeSession"] = []
+            in_flight = 0
+            peak_in_flight = 0
+
+            def __init__(self, **kwargs):
+                self.closed = False
+                FakeSession.instances.append(self)
+
+            def get(self, url: str, **kwargs):
+                FakeSession.urls.append(url)
+                status = pending.pop(0) if len(pending) > 1 else pending[0]
+                return FakeResponse(status)
+
+            async def close(self):
+                self.closed = True
+
+        return FakeSession
+
+    return make
@@ -246,7 +246,7 @@ class TestCachingBehavior:
             def __init__(self):
                 self.status = 200
 
-            async def json(self):
+            async def json(self, **kwargs):
                 return {"api": "data"}
 
         class MockGetContext:
@@ -125,3 +125,318 @@ class TestLeagueHandlers:
             assert result["standings"][0]["wins"] == 10
             assert result["standings"][1]["team"] == "Team Bravo"
             assert result["standings"][1]["rank"] == 2
+
+
+class TestPlayerHandlers:
+    """Test player and waiver wire handlers."""
+
+    @pytest.mark.asyncio
+    async def test_waiver_wire_merges_basic_player_fields(self):
+        """Enhanced waiver players pick up ownership and bye data from matching Yahoo rows."""
+        from lineup_optimizer import Player, lineup_optimizer
+        from src.handlers import player_handlers
+
+        basic_players = [
+            {
+                "name": "Jaylen Waddle",
+                "team": "MIA",
+                "position": "WR",
+                "owned_pct": 42.0,
+                "bye": 12,
+            },
+            {
+                "name": "Tank Dell",
+                "team": "HOU",
+                "position": "WR",
+                "owned_pct": None,
+                "weekly_change": 5,
+            },
+        ]
+        enhanced = [
+            Player(name="Jaylen Waddle", position="WR", team="MIA", yahoo_projection=11.0),
+            Player(name="Tank Dell", position="WR", team="HOU", yahoo_projection=13.0),
+            Player(name="Xavier Worthy", position="WR", team="KC", yahoo_projection=1.0),
+        ]
+
+        with (
+            patch.object(
+                player_handlers, "get_waiver_wire_players", AsyncMock(return_value=basic_players)
+            ),
+            patch.object(
+                lineup_optimizer, "enhance_with_external_data", AsyncMock(return_value=enhanced)
+            ),
+            patch("sleeper_api.get_trending_adds", AsyncMock(return_value=[])),
+        ):
+            result = await player_handlers.handle_ff_get_waiver_wire(
+                {"league_key": "461.l.61410", "include_external_data": False}
+            )
+
+        # Ranked by combined projection when analysis is off
+        assert [p["name"] for p in result["enhanced_players"]] == [
+            "Tank Dell",
+            "Jaylen Waddle",
+            "Xavier Worthy",
+        ]
+
+        by_name = {p["name"]: p for p in result["enhanced_players"]}
+        assert by_name["Jaylen Waddle"]["owned_pct"] == 42.0
+        assert by_name["Jaylen Waddle"]["bye"] == 12
+        assert by_name["Tank Dell"]["owned_pct"] == 0.0
+        assert by_name["Tank Dell"]["weekly_change"] == 5
+        # A matched row missing a field reports None; unmatched players get the defaults
+        assert by_name["Tank Dell"]["bye"] is None
+        assert by_name["Jaylen Waddle"]["weekly_change"] is None
+        assert by_name["Xavier Worthy"]["owned_pct"] == 0.0
+        assert by_name["Xavier Worthy"]["weekly_change"] == 0
+        assert by_name["Xavier Worthy"]["bye"] == "N/A"
+        # Disabled sections keep their keys with placeholder values
+        assert by_name["Jaylen Waddle"]["yahoo_projection"] == 11.0
+        assert by_name["Jaylen Waddle"]["matchup_score"] is None
+        assert by_name["Jaylen Waddle"]["expert_tier"] is None
+
+    @pytest.mark.asyncio
+    async def test_waiver_wire_expert_advice_falls_back_per_player(self):
+        """A failed expert-advice lookup only affects that player."""
+        from lineup_optimizer import Player, lineup_optimizer
+        from sleeper_api import sleeper_client
+        from src.handlers import player_handlers
+
+        basic_players = [
+            {"name": "Jaylen Waddle", "team": "MIA", "position": "WR", "owned_pct": 42.0},
+            {"name": "Tank Dell", "team": "HOU", "position": "WR", "owned_pct": 10.0},
+        ]
+        enhanced = [
+            Player(name="Jaylen Waddle", position="WR", team="MIA"),
+            Player(name="Tank Dell", position="WR", team="HOU"),
+        ]
+
+        async def fake_expert_advice(name, week=None):
+            if name == "Tank Dell":
+                raise RuntimeError("sleeper down")
+            return {"tier": "Strong", "recommendation": "Start", "confidence": 70, "advice": "Go"}
+
+        with (
+            patch.object(
+                player_handlers, "get_waiver_wire_players", AsyncMock(return_value=basic_players)
+            ),
+            patch.object(
+                lineup_optimizer, "enhance_with_external_data", AsyncMock(return_value=enhanced)
+            ),
+            patch.object(sleeper_client, "get_expert_advice", side_effect=fake_expert_advice),
+            patch("sleeper_api.get_trending_adds", AsyncMock(return_value=[])),
+        ):
+            result = await player_handlers.handle_ff_get_waiver_wire(
+                {"league_key": "461.l.61410", "include_analysis": True}
+            )
+
+        by_name = {p["name"]: p for p in result["enhanced_players"]}
+        assert by_name["Jaylen Waddle"]["expert_tier"] == "Strong"
+        assert by_name["Jaylen Waddle"]["expert_confidence"] == 70
+        assert by_name["Tank Dell"]["expert_tier"] == "Depth"
+        assert by_name["Tank Dell"]["expert_advice"] == "Expert analysis unavailable"
+        assert by_name["Jaylen Waddle"]["waiver_priority"] == 29.0
+        assert by_name["Tank Dell"]["waiver_priority"] == 34.8
+        assert by_name["Tank Dell"]["pickup_urgency"] == "Low Priority - Depth option"
+        assert by_name["Jaylen Waddle"]["analysis"] == (
+            "Strong tier player with 70% confidence. Recommendation: Start. "
+            "Priority: 29.0/100 (proj: 0.0, owned: 42.0%, trending: 0)"
+        )
+        assert [p["name"] for p in result["enhanced_players"]] == ["Tank Dell", "Jaylen Waddle"]
+        assert result["analysis_context"]["features"] == [
+            "Yahoo ownership and change data",
+            "Sleeper projections and rankings",
+            "Matchup analysis",
+            "Expert tier classification",
+            "Waiver priority scoring",
+            "Pickup urgency assessment",
+            "Positional scarcity analysis",
+        ]
+        assert result["analysis_context"]["position_scarcity"] == {
+            "WR": {"scarcity_score": 2.6, "avg_ownership": 26.0, "available_count": 2}
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_players_parses_nested_player_payload(
+        self, make_yahoo_league_players_response
+    ):
+        """Player fields are collected from nested Yahoo payload lists in order."""
+        from src.handlers import player_handlers
+
+        yahoo_response = make_yahoo_league_players_response(
+            [
+                [
+                    {"player_key": "461.p.33389"},
+                    {"name": {"full": "Puka Nacua"}},
+                    [{"editorial_team_abbr": "LAR"}],
+                    {"display_position": "WR"},
+                    {"bye_weeks": {"week": "8"}},
+                    {"ownership": {"ownership_percentage": 12.5}},
+                ],
+                {"percent_owned": "97"},
+            ]
+        )
+
+        with patch.object(
+            player_handlers, "yahoo_api_call", AsyncMock(return_value=yahoo_response)
+        ):
+            result = await player_handlers.handle_ff_get_players(
+                {
+                    "league_key": "461.l.61410",
+                    "include_projections": False,
+                    "include_external_data": False,
+                }
+            )
+
+        assert result["total_players"] == 1
+        player = result["players"][0]
+        assert player["name"] == "Puka Nacua"
+        assert player["team"] == "LAR"
+        assert player["position"] == "WR"
+        assert player["bye"] == "8"
+        assert player["owned_pct"] == 97.0
+
+    @pytest.mark.asyncio
+    async def test_player_weekly_points_collects_each_week(
+        self, make_yahoo_league_players_response
+    ):
+        """Weekly points combine Sleeper stats and projections, warning on failures."""
+        import sleeper_api
+        from src.handlers import player_handlers
+
+        yahoo_response = make_yahoo_league_players_response(
+            [
+                [
+                    {"player_key": "461.p.33389"},
+                    {"player_id": "33389"},
+                    {"name": {"full": "Puka Nacua"}},
+                    {"editorial_team_abbr": "LAR"},
+                    {"display_position": "WR"},
+                ]
+            ]
+        )
+        stats_by_week = {
+            1: {"9493": {"pts_ppr": 21.3}},
+            2: {"9493": {"pts": "14.25"}},
+        }
+        projections_by_week = {
+            1: {"9493": {"pts_ppr": 17.0}},
+            3: {"9493": {"projected_stats": [{"pts_ppr": 8.0}, {"pts": 4.5}]}},
+        }
+
+        async def fake_stats(season, week):
+            if week == 3:
+                raise RuntimeError("timeout")
+            return stats_by_week.get(week, {})
+
+        async def fake_projections(season, week):
+            if week == 2:
+                raise RuntimeError("boom")
+            return projections_by_week.get(week, {})
+
+        client = sleeper_api.sleeper_client
+        with (
+            patch.object(player_handlers, "yahoo_api_call", AsyncMock(return_value=yahoo_response)),
+            patch.object(client, "map_yahoo_to_sleeper", AsyncMock(return_value="9493")),
+            patch.object(client, "get_player_stats", side_effect=fake_stats),
+            patch.object(client, "get_projections", side_effect=fake_projections),
+            patch("sleeper_api.get_current_week", AsyncMock(return_value=3)),
+            patch("sleeper_api.get_current_season", AsyncMock(return_value=2025)),
+        ):
+            result = await player_handlers.handle_ff_get_player_weekly_points(
+                {
+                    "league_key": "461.l.61410",
+                    "player_id": "33389",
+                    "season": 2025,
+                    "include_past_projections": True,
+                }
+            )
+
+        assert result["status"] == "success"
+        assert result["player_name"] == "Puka Nacua"
+        assert (result["team"], result["position"]) == ("LAR", "WR")
+        assert result["sleeper_id"] == "9493"
+        assert (result["start_week"], result["end_week"]) == (1, 3)
+        assert result["weeks"] == [
+            {"week_number": 1, "earned_points": 21.3, "sleeper_projected_points": 17.0},
+            {"week_number": 2, "earned_points": 14.25, "sleeper_projected_points": None},
+            {"week_number": 3, "earned_points": None, "sleeper_projected_points": 12.5},
+        ]
+        assert result["warnings"] == [
+            "Week 2: Sleeper projections unavailable (boom)",
+            "Week 3: Sleeper stats unavailable (timeout)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_player_weekly_points_skips_past_projections_by_default(
+        self, make_yahoo_league_players_response
+    ):
+        """Only current and future weeks fetch projections unless past ones are requested."""
+        import sleeper_api
+        from src.handlers import player_handlers
+
+        yahoo_response = make_yahoo_league_players_response()
+        projections = AsyncMock(return_value={"9493": {"pts_ppr": 10.0}})
+
+        client = sleeper_api.sleeper_client
+        with (
+            patch.object(player_handlers, "yahoo_api_call", AsyncMock(return_value=yahoo_response)),
+            patch.object(client, "map_yahoo_to_sleeper", AsyncMock(return_value="9493")),
+            patch.object(client, "get_player_stats", AsyncMock(return_value={})),
+            patch.object(client, "get_projections", projections),
+            patch("sleeper_api.get_current_week", AsyncMock(return_value=3)),
+            patch("sleeper_api.get_current_season", AsyncMock(return_value=2025)),
+        ):
+            result = await player_handlers.handle_ff_get_player_weekly_points(
+                {"league_key": "461.l.61410", "player_id": "1", "end_week": 4}
+            )
+            past_season = await player_handlers.handle_ff_get_player_weekly_points(
+                {"league_key": "461.l.61410", "player_id": "1", "season": 2024}
+            )
+
+        assert [week["sleeper_projected_points"] for week in result["weeks"]] == [
+            None,
+            None,
+            10.0,
+            10.0,
+        ]
+        assert [week["sleeper_projected_points"] for week in past_season["weeks"]] == [None] * 3
+        assert [c.args for c in projections.await_args_list] == [(2025, 3), (2025, 4)]
+
+    @pytest.mark.asyncio
+    async def test_player_weekly_points_skips_fetch_for_empty_range(
+        self, make_yahoo_league_players_response
+    ):
+        """Weeks past 18 and future seasons return no weeks; inverted ranges clamp to start."""
+        import sleeper_api
+        from src.handlers import player_handlers
+
+        yahoo_response = make_yahoo_league_players_response()
+        stats_range = AsyncMock(return_value={})
+        projections_range = AsyncMock(return_value={})
+
+        client = sleeper_api.sleeper_client
+        with (
+            patch.object(player_handlers, "yahoo_api_call", AsyncMock(return_value=yahoo_response)),
+            patch.object(client, "map_yahoo_to_sleeper", AsyncMock(return_value="9493")),
+            patch.object(client, "get_player_stats_range", stats_range),
+            patch.object(client, "get_projections_range", projections_range),
+            patch("sleeper_api.get_current_week", AsyncMock(return_value=3)),
+            patch("sleeper_api.get_current_season", AsyncMock(return_value=2025)),
+        ):
+            past_season_end = await player_handlers.handle_ff_get_player_weekly_points(
+                {"league_key": "461.l.61410", "player_id": "1", "start_week": 19}
+            )
+            future = await player_handlers.handle_ff_get_player_weekly_points(
+                {"league_key": "461.l.61410", "player_id": "1", "season": 2026}
+            )
+            stats_range.assert_not_awaited()
+
+            inverted = await player_handlers.handle_ff_get_player_weekly_points(
+                {"league_key": "461.l.61410", "player_id": "1", "start_week": 10, "end_week": 3}
+            )
+
+        assert past_season_end["status"] == future["status"] == "success"
+        assert past_season_end["weeks"] == future["weeks"] == []
+        assert (inverted["start_week"], inverted["end_week"]) == (10, 10)
+        assert [week["week_number"] for week in inverted["weeks"]] == [10]
+        stats_range.assert_awaited_once_with(2025, 10, 10)
@@ -191,6 +191,11 @@ class TestPlayer:
         assert player.recent_performance == []
         assert player.composite_score == 0.0
 
+    def test_player_name_key(self):
+        """Test lowercased lookup key for player names."""
+        assert Player(name="Ja'Marr Chase", position="WR", team="CIN").name_key == "ja'marr chase"
+        assert Player(name="", position="WR", team="CIN").name_key == ""
+
 
 class TestLineupOptimizer:
     """Test LineupOptimizer functionality."""
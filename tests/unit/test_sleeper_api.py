@@ -0,0 +1,240 @@
+"""Unit tests for sleeper_api.py - Sleeper client caching and request handling."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sleeper_api import SleeperAPI
+
+
+class TestExpertAdviceCache:
+    """Test caching of computed expert advice."""
+
+    @pytest.mark.asyncio
+    async def test_expert_advice_cached_per_player_and_week(self):
+        """Repeat lookups for the same player/week reuse the computed advice."""
+        client = SleeperAPI()
+        build = AsyncMock(return_value={"tier": "Solid", "confidence": 60})
+
+        with patch.object(client, "_build_expert_advice", build):
+            first = await client.get_expert_advice("Josh Allen", 5)
+            second = await client.get_expert_advice("Josh Allen", 5)
+            await client.get_expert_advice("Josh Allen", 6)
+
+        assert first == second == {"tier": "Solid", "confidence": 60}
+        assert build.await_count == 2
+
+
+class TestPlayerMappingCache:
+    """Test caching of Yahoo -> Sleeper player ID matches."""
+
+    @pytest.mark.asyncio
+    async def test_mapping_cached_per_name_position_and_team(self):
+        """Repeat lookups reuse the match; misses are retried."""
+        client = SleeperAPI()
+        match = AsyncMock(side_effect=["4984", "4984", None, None])
+
+        with patch.object(client, "_match_yahoo_to_sleeper", match):
+            assert await client.map_yahoo_to_sleeper("Josh Allen", "QB", "BUF") == "4984"
+            assert await client.map_yahoo_to_sleeper("Josh Allen", "QB", "BUF") == "4984"
+            await client.map_yahoo_to_sleeper("Josh Allen", "QB")
+            assert await client.map_yahoo_to_sleeper("Nobody", "WR") is None
+            assert await client.map_yahoo_to_sleeper("Nobody", "WR") is None
+
+        assert match.await_count == 4
+
+
+class TestPlayerCatalog:
+    """Test post-processing of the Sleeper player catalog."""
+
+    @pytest.mark.asyncio
+    async def test_categorical_player_fields_share_string_objects(self):
+        """Repeated position/team values in the catalog are interned."""
+        client = SleeperAPI()
+        players = {
+            pid: {
+                "first_name": "Player",
+                "last_name": pid,
+                "position": "".join(["W", "R"]),
+                "team": "".join(["K", "C"]),
+                "fantasy_positions": ["".join(["W", "R"])],
+            }
+            for pid in ("1", "2")
+        }
+
+        with patch.object(client, "_make_request", AsyncMock(return_value=players)):
+            catalog = await client.get_all_players()
+
+        first, second = catalog["1"], catalog["2"]
+        assert first["position"] is second["position"] is first["fantasy_positions"][0]
+        assert first["team"] is second["team"]
+
+
+class TestTrendingIndex:
+    """Test the cached trending-adds name index."""
+
+    @pytest.mark.asyncio
+    async def test_trending_index_keyed_by_lowercased_name(self):
+        """Trending adds are indexed by lowercased name and cached per limit."""
+        import sleeper_api
+
+        trending = [{"name": "De'Von Achane", "count": 120}, {"name": "Tank Dell", "count": 45}]
+        fetch = AsyncMock(return_value=trending)
+
+        with (
+            patch.object(sleeper_api, "sleeper_client", SleeperAPI()),
+            patch.object(sleeper_api, "get_trending_adds", fetch),
+        ):
+            players, index = await sleeper_api.get_trending_adds_index(25)
+            await sleeper_api.get_trending_adds_index(25)
+
+        assert players == trending
+        assert index["de'von achane"]["count"] == 120
+        assert index["tank dell"]["count"] == 45
+        fetch.assert_awaited_once_with(25)
+
+    @pytest.mark.asyncio
+    async def test_trending_index_does_not_cache_empty_results(self):
+        """An empty trending list (e.g. Sleeper outage) is fetched again next time."""
+        import sleeper_api
+
+        fetch = AsyncMock(return_value=[])
+
+        with (
+            patch.object(sleeper_api, "sleeper_client", SleeperAPI()),
+            patch.object(sleeper_api, "get_trending_adds", fetch),
+        ):
+            assert await sleeper_api.get_trending_adds_index(10) == ([], {})
+            await sleeper_api.get_trending_adds_index(10)
+
+        assert fetch.await_count == 2
+
+
+class TestRequestConcurrency:
+    """Test the cap on simultaneous Sleeper HTTP requests."""
+
+    @pytest.mark.asyncio
+    async def test_make_request_bounds_concurrent_requests(self, fake_aiohttp_session):
+        """No more than MAX_CONCURRENT_REQUESTS requests are in flight at once."""
+        client = SleeperAPI()
+        session_cls = fake_aiohttp_session(delay=0.01)
+
+        with patch("sleeper_api.aiohttp.ClientSession", session_cls):
+            results = await asyncio.gather(
+                *(client._make_request(f"stats/nfl/2025/{w}", use_cache=False) for w in range(20))
+            )
+
+        assert all(r == {"ok": True} for r in results)
+        assert session_cls.peak_in_flight == SleeperAPI.MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_fetch(self, fake_aiohttp_session):
+        """Simultaneous cache misses for one endpoint issue a single HTTP request."""
+        client = SleeperAPI()
+        session_cls = fake_aiohttp_session(delay=0.01)
+
+        with patch("sleeper_api.aiohttp.ClientSession", session_cls):
+            results = await asyncio.gather(
+                *(client._make_request("stats/nfl/2025/1") for _ in range(5))
+            )
+
+        assert results == [{"ok": True}] * 5
+        assert len(session_cls.urls) == 1
+        assert client._pending_requests == {}
+
+
+class TestRateLimitRetry:
+    """Test backoff and retry on rate-limited Sleeper responses."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(self, fake_aiohttp_session):
+        """A 429 response is retried until it succeeds or retries run out."""
+        client = SleeperAPI()
+        client.RETRY_DELAY = 0
+        session_cls = fake_aiohttp_session(statuses=[429, 429, 200, 429])
+
+        with patch("sleeper_api.aiohttp.ClientSession", session_cls):
+            assert await client._make_request("state/nfl", use_cache=False) == {"ok": True}
+            assert await client._make_request("state/nfl", use_cache=False) is None
+
+        # 3 attempts to succeed, then 1 + MAX_RETRIES attempts before giving up
+        assert len(session_cls.urls) == 3 + 1 + SleeperAPI.MAX_RETRIES
+
+
+class TestSharedSession:
+    """Test reuse of the pooled Sleeper HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_one_session_until_closed(self, fake_aiohttp_session):
+        """Sequential requests share a session; close() makes the next request open a new one."""
+        client = SleeperAPI()
+        session_cls = fake_aiohttp_session()
+
+        with patch("sleeper_api.aiohttp.ClientSession", session_cls):
+            await client._make_request("players/nfl/trending/add", use_cache=False)
+            await client._make_request("state/nfl", use_cache=False)
+            await client.close()
+            await client._make_request("state/nfl", use_cache=False)
+
+        sessions = session_cls.instances
+        assert len(sessions) == 2
+        assert sessions[0].closed and not sessions[1].closed
+
+    def test_session_from_previous_event_loop_is_closed(self, fake_aiohttp_session):
+        """A session created on an earlier event loop is closed when it is replaced."""
+        client = SleeperAPI()
+        session_cls = fake_aiohttp_session()
+
+        with patch("sleeper_api.aiohttp.ClientSession", session_cls):
+            asyncio.run(client._make_request("state/nfl", use_cache=False))
+            asyncio.run(client._make_request("state/nfl", use_cache=False))
+
+        sessions = session_cls.instances
+        assert len(sessions) == 2
+        assert sessions[0].closed and not sessions[1].closed
+
+
+class TestWeeklyDataCaching:
+    """Test cache lifetimes for weekly Sleeper stats."""
+
+    @pytest.mark.asyncio
+    async def test_completed_weeks_cached_longer_than_current_week(self):
+        """Stats for finished weeks use the long stats_final TTL."""
+        client = SleeperAPI()
+        request = AsyncMock(return_value={})
+
+        with (
+            patch.object(
+                client, "get_nfl_state", AsyncMock(return_value={"season": "2025", "week": 6})
+            ),
+            patch.object(client, "_make_request", request),
+        ):
+            await client.get_player_stats(2025, 5)
+            await client.get_player_stats(2025, 6)
+            await client.get_player_stats(2024, 17)
+
+        ttls = [call.kwargs["ttl"] for call in request.await_args_list]
+        assert ttls == [
+            client.cache.default_ttls["stats_final"],
+            client.cache.default_ttls["stats"],
+            client.cache.default_ttls["stats_final"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stats_range_keyed_by_week_with_failures(self):
+        """Range fetches return each week's stats, or the exception that week raised."""
+        client = SleeperAPI()
+        error = RuntimeError("timeout")
+
+        async def fake_stats(season, week):
+            if week == 3:
+                raise error
+            return {"9493": {"pts_ppr": float(week)}}
+
+        with patch.object(client, "get_player_stats", side_effect=fake_stats):
+            by_week = await client.get_player_stats_range(2025, 2, 4)
+            empty = await client.get_player_stats_range(2025, 5, 4)
+
+        assert by_week == {2: {"9493": {"pts_ppr": 2.0}}, 3: error, 4: {"9493": {"pts_ppr": 4.0}}}
+        assert empty == {}